@@ -1,63 +1,274 @@
 import os
 import pandas as pd
-import plotly.express as px
-from dash import Dash, html, dcc, dash_table, Input, Output, State
+from dash import Dash, DiskcacheManager, ctx, html, dcc, dash_table, Input, Output, State
 import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
+from flask_caching import Cache
+import diskcache
 import io
+import math
 import base64
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
 import dash_daq as daq
 import json
 
+try:
+    import orjson  # Optional, much faster JSON encoding of figures and table records
+except ImportError:
+    orjson = None
+
 # Constants
 REQUIRED_COLUMNS = ["Keyword", "URL", "Findings", "Link Response", "Time", "Date"]
+REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+CATEGORY_COLUMNS = {"Keyword": "category", "URL": "category"}  # Low-cardinality columns stored as categoricals
+DATE_FORMAT = "%Y-%m-%d"  # Expected format of the 'Date' column when stored as text
+FOUND_MARKER = "keyword found"  # Lowercase marker in 'Findings' for a successful match
+# Source column names (lowercased) and their standardized names
+COLUMN_MAPPING = {
+    'keyword': 'Keyword',
+    'link': 'URL',  # Map 'link' to 'URL'
+    'findings': 'Findings',
+    'link response': 'Link Response',
+    'time': 'Time',
+    'date': 'Date'
+}
+SOURCE_COLUMNS = frozenset(COLUMN_MAPPING)
+OPENPYXL_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})  # Workbooks openpyxl can read
+MAX_SVG_POINTS = 1000  # Above this many days, Findings Over Time is drawn with WebGL
+MAX_CHART_KEYWORDS = 15  # Keywords shown individually in the keyword charts; the rest are grouped as "Other"
+TABLE_PAGE_SIZE = 50  # Rows sent to the data table per page
+SUMMARY_CACHE_TIMEOUT = 300  # Seconds a date-range summary stays cached
+UPLOAD_CACHE_TIMEOUT = 3600  # Seconds a parsed upload file stays cached on disk
+DATASET_CACHE_TIMEOUT = 8 * 3600  # Seconds an uploaded dataset stays available to the dashboard
+LOADED_DATASET_CACHE_SIZE = 4  # Datasets/aggregates kept unpickled in the web server process
+MAX_PARSE_WORKERS = 8  # Max threads used to parse several uploaded files at once
+
+# Figure layouts built once at import and shared by every dashboard update
+BAR_LAYOUT = go.Layout(template="plotly_dark", coloraxis=dict(colorscale="Viridis"))
+PIE_LAYOUT = go.Layout(template="plotly_dark")
+
+# Dash serializes callback responses through plotly's JSON encoder; prefer orjson when available
+if orjson is not None:
+    pio.json.config.default_engine = "orjson"
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Uploads are parsed in background callbacks so a large workbook doesn't block the server.
+# Background jobs run in separate processes, so parsed files and datasets are shared on disk.
+# Callback results are not cached: every upload re-saves its dataset, while the per-file
+# parse cache keeps re-uploads cheap.
+background_cache = diskcache.Cache("./cache")
+background_callback_manager = DiskcacheManager(background_cache)
 
 # Initialize the Dash app with dark mode using the Bootstrap theme
-app = Dash(__name__, external_stylesheets=[dbc.themes.DARKLY])
+app = Dash(__name__, external_stylesheets=[dbc.themes.DARKLY], background_callback_manager=background_callback_manager)
 app.title = "Dark Web Monitoring Dashboard"
 
+# Server-side cache for date-range summaries, keyed by dataset and date range
+cache = Cache(app.server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': SUMMARY_CACHE_TIMEOUT})
+
 # Function to clean and standardize column names
 def clean_column_names(df):
     """Standardize column names to ensure they match the expected ones."""
-    df.columns = [col.strip().lower() for col in df.columns]  # Remove extra spaces and lowercase all names
-    column_mapping = {
-        'keyword': 'Keyword',
-        'link': 'URL',  # Map 'link' to 'URL'
-        'findings': 'Findings',
-        'link response': 'Link Response',
-        'time': 'Time',
-        'date': 'Date'
-    }
-    df = df.rename(columns=column_mapping)
+    columns = df.columns.astype(str).str.strip().str.lower()  # Remove extra spaces and lowercase all names
+    # Drop columns the dashboard doesn't use before renaming, so nothing copies them later
+    keep = columns.isin(SOURCE_COLUMNS)
+    df = df.loc[:, keep]
+    df.columns = columns[keep].map(COLUMN_MAPPING)
+    # Repeated keywords/URLs are much cheaper to group and count as categoricals
+    df = df.astype({col: dtype for col, dtype in CATEGORY_COLUMNS.items() if col in df.columns})
+    return df
+
+def content_hash(content_string):
+    """Return a fast, stable hash of a base64 upload payload."""
+    return hashlib.blake2b(content_string.encode(), digest_size=16).hexdigest()
+
+def _is_source_column(col):
+    return str(col).strip().lower() in SOURCE_COLUMNS
+
+# Function to read a decoded upload, dispatching on the file extension
+def read_upload(decoded, filename=None):
+    """Read an uploaded Parquet, Feather or Excel file into a DataFrame."""
+    suffix = os.path.splitext(filename or "")[1].lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(io.BytesIO(decoded))
+    if suffix == ".feather":
+        return pd.read_feather(io.BytesIO(decoded))
+    # openpyxl streams the sheet read-only; unused columns are skipped while parsing.
+    # Other workbooks (.xls, .ods, ...) are left to pandas' default engine, which sniffs the format.
+    engine = 'openpyxl' if suffix in OPENPYXL_SUFFIXES else None
+    return pd.read_excel(io.BytesIO(decoded), engine=engine, usecols=_is_source_column)
+
+# Function to parse a single uploaded file
+def parse_uploaded_file(content_key, content_string, filename=None):
+    """Decode and parse one uploaded file, or return None if it is unusable."""
+    # Files seen in an earlier upload skip decode + read_excel
+    df = background_cache.get(('parsed', content_key))
+    if df is not None:
+        return df
+    decoded = base64.b64decode(content_string)
+    df = None
+    try:
+        df = read_upload(decoded, filename)
+        print(f"File loaded successfully with {len(df)} rows. Columns: {df.columns.tolist()}")  # Debugging line
+        # Clean and standardize column names
+        df = clean_column_names(df)
+        if REQUIRED_COLUMN_SET.issubset(df.columns):
+            df = df[REQUIRED_COLUMNS]
+        else:
+            print("Uploaded file does not contain required columns.")
+            df = None
+    except Exception as e:
+        print(f"Error processing the uploaded file: {e}")
+        return None  # Don't cache failures, the next upload may succeed
+    if df is not None:
+        background_cache.set(('parsed', content_key), df, expire=UPLOAD_CACHE_TIMEOUT)
     return df
 
+# Function to combine parsed files
+def concat_frames(data_frames):
+    """Concatenate parsed files, keeping the categorical columns categorical."""
+    if len(data_frames) == 1:
+        return data_frames[0]
+    # pd.concat falls back to object columns unless every frame shares the same categories
+    dtypes = {}
+    for col in CATEGORY_COLUMNS:
+        categories = data_frames[0][col].cat.categories.append([df[col].cat.categories for df in data_frames[1:]])
+        dtypes[col] = pd.CategoricalDtype(categories.unique())
+    return pd.concat([df.astype(dtypes) for df in data_frames], ignore_index=True)
+
 # Function to process uploaded files
-def process_uploaded_files(contents):
-    """Process the uploaded Excel files and return a combined DataFrame."""
-    data_frames = []
-    for content in contents:
-        # Decode the uploaded file
+def process_uploaded_files(contents, filenames=None):
+    """Process the uploaded files and return a combined DataFrame.
+
+    Parsed files are cached on disk by a hash of their content, so a file seen
+    in an earlier upload is not decoded and parsed again.
+    """
+    filenames = filenames or [None] * len(contents)
+    uploads = []
+    for content, filename in zip(contents, filenames):
+        # Split off the data URL header and hash the base64 payload
         content_type, content_string = content.split(',')
-        decoded = base64.b64decode(content_string)
-        try:
-            df = pd.read_excel(io.BytesIO(decoded))
-            print(f"File loaded successfully with {len(df)} rows. Columns: {df.columns.tolist()}")  # Debugging line
-            # Clean and standardize column names
-            df = clean_column_names(df)
-            if all(col in df.columns for col in REQUIRED_COLUMNS):
-                data_frames.append(df[REQUIRED_COLUMNS])
-            else:
-                print("Uploaded file does not contain required columns.")
-        except Exception as e:
-            print(f"Error processing the uploaded file: {e}")
-    
+        uploads.append((content_hash(content_string), content_string, filename))
+
+    # Parse several files concurrently; a single file is parsed inline
+    workers = min(MAX_PARSE_WORKERS, len(uploads), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(lambda upload: parse_uploaded_file(*upload), uploads))
+    else:
+        parsed = [parse_uploaded_file(*upload) for upload in uploads]
+    data_frames = [df for df in parsed if df is not None]
+
     if data_frames:
-        return pd.concat(data_frames, ignore_index=True)
+        return concat_frames(data_frames)
     else:
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
 
+# Function to parse the 'Date' column
+def parse_dates(values):
+    """Parse dates with the known format, falling back to inference for other layouts."""
+    dates = pd.to_datetime(values, format=DATE_FORMAT, errors='coerce', cache=True)
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed], errors='coerce')
+    return dates
+
+# Functions to keep the parsed upload on the server, keyed by a hash of the uploaded files
+def dataset_hash(contents):
+    """Return a hash identifying a set of uploaded files."""
+    digest = hashlib.blake2b(digest_size=16)
+    for content in contents:
+        digest.update(content.encode())
+    return digest.hexdigest()
+
+def save_dataset(dataset_key, data, aggregates):
+    # The background cache is shared with the upload jobs, which run in their own processes
+    background_cache.set(('aggregates', dataset_key), aggregates, expire=DATASET_CACHE_TIMEOUT)
+    background_cache.set(('dataset', dataset_key), data, expire=DATASET_CACHE_TIMEOUT)
+
+# Keys are content hashes, so a loaded frame never goes stale; callers must not modify it.
+# Keeping recent ones in memory saves a disk read + unpickle on every page flip.
+@functools.lru_cache(maxsize=LOADED_DATASET_CACHE_SIZE)
+def _load_cached(kind, dataset_key):
+    value = background_cache.get((kind, dataset_key))
+    if value is None:
+        print("Uploaded data is no longer cached, please upload the files again.")
+        raise PreventUpdate
+    return value
+
+def load_dataset(dataset_key):
+    """Return the date-indexed upload data saved under dataset_key."""
+    return _load_cached('dataset', dataset_key)
+
+def load_aggregates(dataset_key):
+    """Return the per-day aggregates (see aggregate_by_date) saved under dataset_key."""
+    return _load_cached('aggregates', dataset_key)
+
+# Function to pre-aggregate findings per day
+def aggregate_by_date(data):
+    """Return per-day totals, keyword counts and found-keyword counts for the whole upload.
+
+    The dashboard callback only has to slice and sum these for a date range.
+    """
+    day = data['Date'].dt.normalize().rename('Date')
+    found_mask = data['_findings_lower'].str.contains(FOUND_MARKER, regex=False, na=False).astype(bool)
+    # Found totals per day count every matching row, including rows without a Keyword
+    daily_findings = pd.DataFrame({
+        'Findings Count': data.groupby(day).size(),
+        'Found Count': found_mask.groupby(day).sum(),
+    })
+    # One grouping pass yields both the keyword frequency and the found-keyword count
+    found = found_mask.astype('int8').rename('_found')
+    keyword_stats = found.groupby([day, data['Keyword']], observed=True).agg(['size', 'sum'])
+    keyword_by_date = keyword_stats['size'].unstack(fill_value=0)
+    found_by_date = keyword_stats['sum'].unstack(fill_value=0)
+    return {'daily': daily_findings, 'keywords': keyword_by_date, 'found': found_by_date}
+
+# Function to cap the number of keywords drawn in a chart
+def top_with_other(counts, n=MAX_CHART_KEYWORDS):
+    """Return the n largest counts, with the remainder summed into an "Other (k keywords)" entry."""
+    counts = counts.sort_values(ascending=False)
+    if len(counts) <= n:
+        return counts
+    rest = counts.iloc[n:]
+    # Name the bucket after its size so it can't collide with a real keyword such as 'Other'
+    other_label = f"Other ({len(rest)} keywords)"
+    return pd.concat([counts.iloc[:n], pd.Series({other_label: rest.sum()})])
+
+# Functions to build the dashboard figures from precomputed values
+def bar_figure(x, y, title, x_title, y_title):
+    """Build a bar chart colored by value on the shared dark layout."""
+    bar = go.Bar(x=x, y=y, marker=dict(color=y, coloraxis="coloraxis"))
+    fig = go.Figure(bar, layout=BAR_LAYOUT)
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, coloraxis_colorbar_title=y_title)
+    return fig
+
+def timeline_figure(x, y, title, x_title, y_title):
+    """Build the findings timeline, switching from SVG bars to WebGL for long ranges."""
+    if len(x) <= MAX_SVG_POINTS:
+        return bar_figure(x, y, title, x_title, y_title)
+    trace = go.Scattergl(x=x, y=y, mode='lines+markers', marker=dict(color=y, coloraxis="coloraxis"))
+    fig = go.Figure(trace, layout=BAR_LAYOUT)
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, coloraxis_colorbar_title=y_title)
+    return fig
+
+def pie_figure(labels, values, title):
+    """Build a pie chart on the shared dark layout."""
+    fig = go.Figure(go.Pie(labels=labels, values=values), layout=PIE_LAYOUT)
+    fig.update_layout(title=title)
+    return fig
+
+# Function to convert a DataFrame into DataTable records
+def frame_to_records(df):
+    """Return DataTable records using pandas' C JSON writer instead of to_dict('records')."""
+    # Second precision keeps dates looking like '2024-04-10T00:00:00', as to_dict('records') showed them
+    return json_loads(df.to_json(orient='records', date_format='iso', date_unit='s'))
+
 # Dashboard layout with enhanced styles
 app.layout = html.Div([
     # Header section with title centered
@@ -114,11 +325,14 @@ app.layout = html.Div([
         ], style={"marginBottom": "20px"}),
     ]),
 
+    # Key of the parsed upload data and its per-day aggregates, both kept on the server
+    dcc.Store(id="dataset-key", storage_type="memory"),
+
     # File upload component - Button styled to be clickable (not a whole bar)
     html.Div([
         dcc.Upload(
             id="upload-data",
-            children=html.Button("Upload Excel Files", style={
+            children=html.Button("Upload Files", style={
                 'backgroundColor': '#007bff', 
                 'color': 'white', 
                 'border': 'none', 
@@ -128,8 +342,12 @@ app.layout = html.Div([
                 'boxShadow': '0px 4px 6px rgba(0, 0, 0, 0.1)',  # Adding shadow for 3D effect
                 'transition': 'all 0.3s ease-in-out'  # Smooth transition effect
             }),
+            accept=".xlsx,.xlsm,.xls,.ods,.parquet,.feather",
             multiple=True
-        )
+        ),
+        # Upload progress, only visible while files are being processed
+        dbc.Progress(id="upload-progress", value=0, striped=True, animated=True,
+                     style={'visibility': 'hidden', 'marginTop': '10px'}),
     ], style={'textAlign': 'center', 'marginBottom': '20px'}),
         
     # Loading Spinner and content display
@@ -149,6 +367,12 @@ app.layout = html.Div([
             # Data Table displaying the raw data
             dash_table.DataTable(
                 id="data-table",
+                columns=[{'name': col, 'id': col} for col in REQUIRED_COLUMNS],
+                # Pages are cut server-side so only the visible rows are sent to the browser
+                page_action='custom',
+                page_current=0,
+                page_size=TABLE_PAGE_SIZE,
+                fixed_rows={'headers': True},
                 style_table={'height': '500px', 'overflowY': 'auto', 'borderRadius': '15px'},
                 style_cell={'color': 'white', 'backgroundColor': '#343A40', 'textAlign': 'center'},
                 style_header={'backgroundColor': '#495057', 'color': 'white', 'fontWeight': 'bold'},
@@ -164,7 +388,45 @@ app.layout = html.Div([
     )
 ])
 
-# Callback for updating the dashboard based on uploaded files
+# Callback for parsing uploaded files into the store
+@app.callback(
+    Output("dataset-key", "data"),
+    Input("upload-data", "contents"),
+    State("upload-data", "filename"),
+    background=True,
+    running=[
+        (Output("upload-data", "disabled"), True, False),
+        (Output("upload-progress", "style"), {'visibility': 'visible', 'marginTop': '10px'},
+         {'visibility': 'hidden', 'marginTop': '10px'}),
+    ],
+    progress=[Output("upload-progress", "value")],
+    prevent_initial_call=True,
+)
+def load_uploaded_data(set_progress, contents, filenames):
+    # Check if the files are uploaded
+    if contents is None:
+        raise PreventUpdate
+    set_progress((0,))
+
+    # Process the uploaded files and load them into a dataframe
+    data = process_uploaded_files(contents, filenames)
+    set_progress((60,))
+
+    # Convert 'Date' column to datetime format
+    # Lowercase 'Findings' once here so the filter callback can use a plain substring match
+    data = data.assign(Date=parse_dates(data['Date']), _findings_lower=data['Findings'].str.lower())
+
+    # Rows without a usable date can never match a date range; sort so the range is a slice
+    data = data.dropna(subset=['Date']).sort_values('Date', kind='stable')
+    set_progress((80,))
+
+    # Keep the rows (with their DatetimeIndex) and aggregates server-side; only the key goes to the browser
+    dataset_key = dataset_hash(contents)
+    save_dataset(dataset_key, data[REQUIRED_COLUMNS].set_index('Date'), aggregate_by_date(data))
+
+    return dataset_key
+
+# Callback for updating the dashboard based on the stored data and date range
 @app.callback(
     [
         Output("total-findings", "children"),
@@ -174,89 +436,121 @@ app.layout = html.Div([
         Output("findings-over-time", "figure"),
         Output("keyword-frequency", "figure"),
         Output("success-frequency", "figure"),
-        Output("data-table", "data"),
     ],
     [
-        Input("upload-data", "contents"),
+        Input("dataset-key", "data"),
         Input("date-picker-range", "start_date"),
         Input("date-picker-range", "end_date"),
     ]
 )
-def update_dashboard(contents, start_date, end_date):
-    # Check if the files are uploaded
-    if contents is None:
+def update_dashboard(dataset_key, start_date, end_date):
+    # Nothing to show until files have been uploaded
+    if dataset_key is None:
         raise PreventUpdate
 
-    # Process the uploaded files and load them into a dataframe
-    data = process_uploaded_files(contents)
+    return summarize_range(dataset_key, start_date, end_date)
 
-    # Convert 'Date' column to datetime format
-    data['Date'] = pd.to_datetime(data['Date'])
+# Function to compute the dashboard statistics and figures for a date range
+@cache.memoize()
+def summarize_range(dataset_key, start_date, end_date):
+    """Return the card texts and figure dicts for a date range.
+
+    Memoized on (dataset_key, start_date, end_date).
+    """
+    data = load_dataset(dataset_key)
+    aggregates = load_aggregates(dataset_key)
 
-    # Filter data based on date range
-    filtered_data = data[(data['Date'] >= pd.to_datetime(start_date)) & (data['Date'] <= pd.to_datetime(end_date))]
+    # Filter data and the per-day aggregates based on date range (slices on sorted DatetimeIndexes)
+    filtered_data = data.loc[start_date:end_date]
+    daily_totals = aggregates['daily'].loc[start_date:end_date]
+    daily_findings = daily_totals['Findings Count']
+    keyword_counts = aggregates['keywords'].loc[start_date:end_date].sum(axis=0)
+    keyword_counts = keyword_counts[keyword_counts > 0]
+    found_counts = aggregates['found'].loc[start_date:end_date].sum(axis=0)
+    found_counts = found_counts[found_counts > 0]
+
+    # Counts are non-negative and small; narrow them so the figure arrays are smaller on the wire
+    daily_findings = pd.to_numeric(daily_findings, downcast='unsigned')
+    keyword_counts = pd.to_numeric(keyword_counts, downcast='unsigned')
+    found_counts = pd.to_numeric(found_counts, downcast='unsigned')
 
     # Total Findings
-    total_findings = len(filtered_data)
+    total_findings = int(daily_findings.sum())
 
     # Unique Keywords
-    unique_keywords = len(filtered_data['Keyword'].unique())
+    unique_keywords = len(keyword_counts)
 
     # Monitored URLs
-    monitored_urls = len(filtered_data['URL'].unique())
+    monitored_urls = filtered_data['URL'].nunique()
 
-    # Correctly calculate Found Keywords based on presence of 'Keyword found' in the Findings column
-    found_keywords = filtered_data[filtered_data['Findings'].str.contains("Keyword found", case=False, na=False)]
-    found_keyword_count = len(found_keywords)
+    # Found Keywords, counted on rows whose Findings contain 'Keyword found'
+    found_keyword_count = int(daily_totals['Found Count'].sum())
 
     # Findings Over Time (Bar chart)
-    findings_over_time = filtered_data.groupby(['Date']).size().reset_index(name='Findings Count')
-    findings_fig = px.bar(
-        findings_over_time, 
-        x='Date', 
-        y='Findings Count', 
-        title="Findings Over Time", 
-        template="plotly_dark", 
-        color='Findings Count', 
-        color_continuous_scale="Viridis"
+    findings_fig = timeline_figure(
+        daily_findings.index,
+        daily_findings.to_numpy(),
+        "Findings Over Time",
+        'Date',
+        'Findings Count'
     )
 
     # Keyword Frequency (Bar chart for all keywords, regardless of findings)
-    keyword_data = filtered_data['Keyword'].value_counts().reset_index()
-    keyword_data.columns = ['Keyword', 'Frequency']
-    keyword_frequency_fig = px.bar(
-        keyword_data, 
-        x='Keyword', 
-        y='Frequency', 
-        title="Keyword Frequency (All)", 
-        template="plotly_dark", 
-        color='Frequency',
-        color_continuous_scale="Viridis"
+    keyword_data = top_with_other(keyword_counts)
+    keyword_frequency_fig = bar_figure(
+        keyword_data.index,
+        keyword_data.to_numpy(),
+        "Keyword Frequency (All)",
+        'Keyword',
+        'Frequency'
     )
 
     # Keyword Success Rate (Pie chart showing only found keywords)
-    success_counts = found_keywords.groupby('Keyword').size().reset_index(name='Count')
-    success_fig = px.pie(
-        success_counts, 
-        names='Keyword', 
-        values='Count', 
-        title="Keyword Success Rate", 
-        template="plotly_dark"
-    )
-
-    # Convert DataFrame to dictionary for DataTable
-    table_data = filtered_data.to_dict('records')
+    success_counts = top_with_other(found_counts)
+    success_fig = pie_figure(success_counts.index, success_counts.to_numpy(), "Keyword Success Rate")
 
     return (
         f"Total Findings: {total_findings}", 
         f"Unique Keywords: {unique_keywords}", 
         f"Monitored URLs: {monitored_urls}", 
         f"Found Keywords: {found_keyword_count}",
-        findings_fig, 
-        keyword_frequency_fig, 
-        success_fig, 
-        table_data
+        findings_fig.to_dict(), 
+        keyword_frequency_fig.to_dict(), 
+        success_fig.to_dict()
     )
 
+# Callback for serving the current page of the data table
+@app.callback(
+    [
+        Output("data-table", "data"),
+        Output("data-table", "page_count"),
+        Output("data-table", "page_current"),
+    ],
+    [
+        Input("dataset-key", "data"),
+        Input("date-picker-range", "start_date"),
+        Input("date-picker-range", "end_date"),
+        Input("data-table", "page_current"),
+        Input("data-table", "page_size"),
+    ]
+)
+def update_table(dataset_key, start_date, end_date, page_current, page_size):
+    if dataset_key is None:
+        raise PreventUpdate
+
+    filtered_data = load_dataset(dataset_key).loc[start_date:end_date]
+
+    # A new upload or date range starts from the first page; otherwise clamp to the last page
+    if ctx.triggered_id != "data-table":
+        page_current = 0
+    page_size = page_size or TABLE_PAGE_SIZE
+    page_count = max(1, math.ceil(len(filtered_data) / page_size))
+    page_current = min(page_current or 0, page_count - 1)
+    start = page_current * page_size
+
+    # Convert only the requested page to DataTable records
+    page = filtered_data.iloc[start:start + page_size].reset_index()[REQUIRED_COLUMNS]
+    return frame_to_records(page), page_count, page_current
+
 if __name__ == "__main__":
     app.run_server(debug=True)